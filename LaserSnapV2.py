@@ -2,24 +2,36 @@
 # 1. IMPORTS
 # ------------------------------
 # Standard library imports
+import atexit
 import os
 import shutil
 import time
+from operator import itemgetter
 from datetime import datetime
 import csv
+import queue
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; _clone_file skips the reflink path
+    fcntl = None
+
 # Third-party imports
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pyvisa
 import serial.tools.list_ports
 import spectral.io.envi as envi
-import spectral as spy
 from PIL import Image, ImageTk, ImageOps
 import logging
+import logging.handlers
 import numpy as np
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 
 # ------------------------------
 # 2. CONSTANTS AND GLOBAL VARIABLES
@@ -28,11 +40,13 @@ import numpy as np
 SAVED_IMAGES_DIRECTORY = r'C:\BaySpec\GoldenEye\saved_images'
 
 # Data storage
-before_snapshot = []
+before_snapshot = set()
 loaded_cubes = []
 loaded_images = []
-selected_images = []
+selected_images = set()  # Indices into loaded_cubes; sort where order matters
 available_wavelengths = set()
+wavelength_index = {}  # wavelength -> indices into loaded_cubes
+acquisition_plan = {}  # tree iid -> (wavelength, num_pictures), mirrors the treeview
 
 # Project information
 experiment_finished = False
@@ -46,108 +60,341 @@ golden_eye_found = False
 tls_device_address = None
 arduino_port = None
 trigger_string = 'trigger\n'
+_arduino_ser = None  # Persistent serial connection to the Arduino
+_visa_rm = None  # Shared pyvisa ResourceManager, created on first use
+_tls_device = None  # Persistent VISA session to the TLS monochromator
 
 # Acquisition monitoring
 acquisition_log = []  # New: tracks acquisition progress
 file_timeout = 60  # New: timeout in seconds for file creation
 acquisition_log_path = ""  # New: path to current acquisition log
-
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+device_lock = threading.Lock()  # Serializes TLS/Arduino access across threads
+acquisition_log_rows = []  # In-memory copy of the log rows (header excluded)
+acquisition_log_offsets = []  # Byte offset of each row in the open log file
+_log_fh = None  # Open handle to the current acquisition log
+_log_writer = None  # csv.writer bound to _log_fh
+
+# Fixed widths for the mutable log fields so an updated row occupies exactly
+# the same bytes as the pending row it replaces (allows in-place overwrite)
+LOG_RAW_FILENAME_WIDTH = 48
+LOG_STATUS_WIDTH = 10
+LOG_FILE_SIZE_WIDTH = 12
+
+# Virtual image grid: only the rows visible in the canvas get real Tk
+# widgets; thumbnails are held in a small LRU cache instead of one
+# PhotoImage per cube for the life of the session
+GRID_COLUMNS = 4
+GRID_TILE_WIDTH = 210  # 200 px thumbnail + padding
+GRID_TILE_HEIGHT = 195  # thumbnail + checkbox row + padding
+THUMB_CACHE_SIZE = 64
+grid_indices = []  # Cube indices currently shown by the grid, in order
+_grid_tiles = {}  # grid position -> instantiated tile frame
+_tile_pool = []  # recycled tile frames awaiting reuse
+_thumb_cache = OrderedDict()  # rgb path -> PhotoImage (LRU)
+_pil_thumb_cache = {}  # rgb path -> decoded PIL image awaiting PhotoImage wrap
+
+# Number of cube lines reduced per tile when summing/averaging memmapped
+# cubes — keeps the working set a few MB so it fits in cache
+REDUCTION_TILE_LINES = 64
+
+# Raw data folder watcher (event-driven replacement for listdir polling)
+_raw_file_queue = queue.Queue()  # New .bin filenames pushed by the watcher
+_raw_observer = None  # watchdog Observer for the raw data folder
+
+# Saved images directory watcher (new capture folders)
+file_arrived = threading.Event()  # Set when a new capture folder appears
+_new_folder_queue = queue.Queue()  # New capture folder names from the watcher
+_saved_images_observer = None
+current_acquisition_index = 0
+
+# Status messages from acquisition workers, drained on the Tk thread
+status_queue = queue.Queue()
+
+# Setup logging — records pass through a queue so handler I/O happens on the
+# listener thread instead of the Tk or acquisition threads
+_log_queue = queue.Queue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.getLogger().addHandler(_queue_handler)
+logging.getLogger().setLevel(logging.INFO)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
 
 
 # ------------------------------
 # 3. UTILITY FUNCTIONS
 # ------------------------------
 def sort_folders_by_modification(folders):
-    folders_with_time = [(folder, os.path.getmtime(os.path.join(SAVED_IMAGES_DIRECTORY, folder))) for folder in folders]
-    sorted_folders = sorted(folders_with_time, key=lambda x: x[1])
-    return [folder[0] for folder in sorted_folders]
+    # A single scandir pass reads the mtimes straight off the cached
+    # DirEntry objects instead of one stat() + path join per folder; the
+    # sort then only does O(1) dict lookups for its keys. Pre-seeding the
+    # map keeps folders that vanished mid-run from crashing the sort.
+    mtimes = dict.fromkeys(folders, 0.0)
+    with os.scandir(SAVED_IMAGES_DIRECTORY) as it:
+        for entry in it:
+            if entry.name in mtimes and entry.is_dir():
+                mtimes[entry.name] = entry.stat(follow_symlinks=False).st_mtime
+    return sorted(mtimes, key=mtimes.get)
+
+
+FICLONE = 0x40049409  # Linux ioctl: copy-on-write clone of a whole file
+
+
+def _clone_file(src, dst):
+    """copytree copy_function that avoids pushing file bytes through Python
+
+    Tries, in order: a hard link (same filesystem, O(1), keeps the source
+    intact), a copy-on-write reflink, an in-kernel os.copy_file_range loop,
+    and finally shutil.copy2. Cube .bin files run to hundreds of MB, so
+    skipping the Python read/write loop matters."""
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError:
+        pass
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                    shutil.copystat(src, dst)
+                    return dst
+                except OSError:
+                    pass
+            if hasattr(os, 'copy_file_range'):
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                if remaining == 0:
+                    shutil.copystat(src, dst)
+                    return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
 
 
 def create_acquisition_log_file():
-    """Create a CSV log file for tracking acquisitions"""
+    """Create a CSV log file for tracking acquisitions
+
+    The file handle is kept open for the whole acquisition so updates can be
+    appended (or overwritten in place) without re-reading the file."""
+    global _log_fh, _log_writer
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"acquisition_log_{project_name}_{timestamp}.csv"
     log_path = os.path.join(output_path, log_filename)
 
-    with open(log_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['Index', 'Wavelength', 'Picture_Number', 'Expected_Name',
-                         'Raw_Filename', 'Status', 'Timestamp', 'File_Size_Bytes'])
+    if _log_fh is not None and not _log_fh.closed:
+        _log_fh.close()
+
+    _log_fh = open(log_path, 'w+', newline='', buffering=1)
+    _log_writer = csv.writer(_log_fh)
+    _log_writer.writerow(['Index', 'Wavelength', 'Picture_Number', 'Expected_Name',
+                          'Raw_Filename', 'Status', 'Timestamp', 'File_Size_Bytes'])
+    _log_fh.flush()
+
+    acquisition_log_rows.clear()
+    acquisition_log_offsets.clear()
 
     return log_path
 
 
 def update_acquisition_log(log_path, index, wavelength, pic_num, expected_name,
-                           raw_filename='', status='pending', file_size=0):
+                           raw_filename='', status='pending', file_size=0,
+                           timestamp=None):
     """Update the acquisition log with new information
-    Status can be: pending, completed, timeout, cancelled"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    Status can be: pending, completed, timeout, cancelled
+
+    Rows are kept in memory (acquisition_log_rows) so nothing is re-read from
+    disk. A new index is appended; an existing index is overwritten in place
+    by seeking to its recorded byte offset. The mutable fields are padded to
+    fixed widths so the rewritten row is byte-for-byte the same length.
+
+    Callers updating many rows back-to-back can pass a precomputed timestamp
+    instead of paying for datetime.now().strftime per row."""
+    if _log_fh is None or _log_fh.closed:
+        logging.error("Acquisition log is not open; call create_acquisition_log_file first")
+        return
+
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # An overwritten row must stay exactly as long as the row it replaces,
+    # or it bleeds into the next one — clamp instead of corrupting the log
+    if len(raw_filename) > LOG_RAW_FILENAME_WIDTH:
+        logging.warning(f"Raw filename truncated in acquisition log: {raw_filename}")
+        raw_filename = raw_filename[:LOG_RAW_FILENAME_WIDTH]
+
+    row = [index, wavelength, pic_num, expected_name,
+           raw_filename.ljust(LOG_RAW_FILENAME_WIDTH),
+           status.ljust(LOG_STATUS_WIDTH),
+           timestamp,
+           str(file_size).zfill(LOG_FILE_SIZE_WIDTH)]
+
+    if index == len(acquisition_log_rows):
+        # New entry: append at the end of the file
+        _log_fh.seek(0, os.SEEK_END)
+        acquisition_log_offsets.append(_log_fh.tell())
+        acquisition_log_rows.append(row)
+        _log_writer.writerow(row)
+    else:
+        # Existing entry: overwrite its row in place
+        acquisition_log_rows[index] = row
+        _log_fh.seek(acquisition_log_offsets[index])
+        _log_writer.writerow(row)
+
+    _log_fh.flush()
+
+
+class SavedFolderHandler(FileSystemEventHandler):
+    """Push newly created capture folders into a queue"""
+
+    def on_created(self, event):
+        # Only directory-create events matter here; file-level noise inside
+        # existing capture folders is ignored
+        if event.is_directory:
+            _new_folder_queue.put(os.path.basename(event.src_path))
+            file_arrived.set()
+
+
+def start_saved_images_watcher():
+    """Start the OS-level watcher on the Golden Eye saved images directory"""
+    global _saved_images_observer
+
+    if not os.path.isdir(SAVED_IMAGES_DIRECTORY):
+        logging.warning(f"Saved images directory not found: {SAVED_IMAGES_DIRECTORY}")
+        return
+
+    _saved_images_observer = Observer()
+    _saved_images_observer.schedule(SavedFolderHandler(), SAVED_IMAGES_DIRECTORY, recursive=False)
+    _saved_images_observer.daemon = True
+    _saved_images_observer.start()
+    logging.info(f"Watching saved images directory: {SAVED_IMAGES_DIRECTORY}")
+
+
+class RawFileHandler(FileSystemEventHandler):
+    """Push newly created .bin files from the raw data folder into a queue"""
+
+    def on_created(self, event):
+        if not event.is_directory and event.src_path.endswith('.bin'):
+            _raw_file_queue.put(os.path.basename(event.src_path))
 
-    # Check if entry exists
-    existing_data = []
-    if os.path.exists(log_path):
-        with open(log_path, 'r', newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            existing_data = list(reader)
-
-    # Update or append entry
-    entry_found = False
-    for i, row in enumerate(existing_data[1:], 1):  # Skip header
-        if len(row) > 0 and int(row[0]) == index:
-            existing_data[i] = [index, wavelength, pic_num, expected_name,
-                                raw_filename, status, timestamp, file_size]
-            entry_found = True
+    def on_moved(self, event):
+        # Some writers create a temp file and rename it when done
+        if not event.is_directory and event.dest_path.endswith('.bin'):
+            _raw_file_queue.put(os.path.basename(event.dest_path))
+
+
+def start_raw_folder_watcher():
+    """(Re)start the OS-level directory watcher on the raw data folder"""
+    global _raw_observer
+
+    if _raw_observer is not None:
+        _raw_observer.stop()
+
+    # Drop stale notifications from a previously watched folder
+    while not _raw_file_queue.empty():
+        try:
+            _raw_file_queue.get_nowait()
+        except queue.Empty:
             break
 
-    if not entry_found and existing_data:
-        existing_data.append([index, wavelength, pic_num, expected_name,
-                              raw_filename, status, timestamp, file_size])
+    _raw_observer = Observer()
+    _raw_observer.schedule(RawFileHandler(), raw_data_folder, recursive=False)
+    _raw_observer.daemon = True
+    _raw_observer.start()
+    logging.info(f"Watching raw data folder: {raw_data_folder}")
+
+
+def bulk_write_acquisition_log(log_path, entries):
+    """Write pending rows for a whole acquisition plan in one pass
+
+    Used when pre-populating the log at acquisition start: one timestamp,
+    one flush, instead of a separate update per entry."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    for entry in entries:
+        row = [entry['index'], entry['wavelength'], entry['pic_num'], entry['expected_name'],
+               ''.ljust(LOG_RAW_FILENAME_WIDTH),
+               'pending'.ljust(LOG_STATUS_WIDTH),
+               timestamp,
+               '0'.zfill(LOG_FILE_SIZE_WIDTH)]
+        acquisition_log_offsets.append(_log_fh.tell())
+        acquisition_log_rows.append(row)
+        _log_writer.writerow(row)
+
+    _log_fh.flush()
+
+
+def cancel_remaining_acquisitions(start_index):
+    """Mark every log row from start_index onward as cancelled in one write
+
+    Mutates the in-memory rows, then overwrites the tail of the file with a
+    single writerows call. The fixed-width fields guarantee the rewritten
+    tail lines up byte-for-byte with the rows it replaces."""
+    if start_index >= len(acquisition_log_rows):
+        return
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for row in acquisition_log_rows[start_index:]:
+        row[5] = 'cancelled'.ljust(LOG_STATUS_WIDTH)
+        row[6] = timestamp
 
-    # Write back to file
-    with open(log_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerows(existing_data)
+    _log_fh.seek(acquisition_log_offsets[start_index])
+    _log_writer.writerows(acquisition_log_rows[start_index:])
+    _log_fh.flush()
 
 
 def wait_for_new_file(timeout_seconds=60):
-    """Wait for a new file to be created in the raw data folder"""
+    """Wait for a new file to be created in the raw data folder
+
+    The directory watcher delivers filenames the moment the OS reports them,
+    so there is no polling here — just a blocking queue read plus a short
+    size-stability check to make sure the file is fully written."""
     if not raw_data_folder or not os.path.exists(raw_data_folder):
         logging.error("Raw data folder not set or doesn't exist")
         return None
 
-    # Get initial list of files
-    initial_files = set(os.listdir(raw_data_folder))
-    start_time = time.time()
+    if _raw_observer is None or not _raw_observer.is_alive():
+        logging.error("Raw data folder watcher is not running")
+        return None
 
     logging.info(f"Waiting for new file in {raw_data_folder}...")
 
-    while time.time() - start_time < timeout_seconds:
-        try:
-            current_files = set(os.listdir(raw_data_folder))
-            new_files = current_files - initial_files
-
-            # Look for new .bin files
-            for new_file in new_files:
-                if new_file.endswith('.bin'):
-                    file_path = os.path.join(raw_data_folder, new_file)
-                    file_size = os.path.getsize(file_path)
+    deadline = time.time() + timeout_seconds
 
-                    # Wait a bit to ensure file is fully written
-                    time.sleep(2)
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
 
-                    # Check if file size is stable
-                    new_size = os.path.getsize(file_path)
-                    if new_size == file_size and file_size > 0:
-                        logging.info(f"New file detected: {new_file} (size: {file_size} bytes)")
-                        return new_file
+        try:
+            new_file = _raw_file_queue.get(timeout=remaining)
+        except queue.Empty:
+            break
 
-            time.sleep(1)  # Check every second
+        file_path = os.path.join(raw_data_folder, new_file)
 
-        except Exception as e:
-            logging.error(f"Error checking for new files: {e}")
-            time.sleep(1)
+        try:
+            # Confirm the file has been fully written before reporting it
+            file_size = os.path.getsize(file_path)
+            while time.time() < deadline:
+                time.sleep(0.2)
+                new_size = os.path.getsize(file_path)
+                if new_size == file_size and file_size > 0:
+                    logging.info(f"New file detected: {new_file} (size: {file_size} bytes)")
+                    return new_file
+                file_size = new_size
+        except OSError as e:
+            logging.error(f"Error checking new file {new_file}: {e}")
 
     # Timeout reached
     logging.warning(f"Timeout: No new file detected in {timeout_seconds} seconds")
@@ -155,9 +402,35 @@ def wait_for_new_file(timeout_seconds=60):
 
 
 def update_status_label(message):
-    """Update the acquisition status label in the UI"""
-    if 'acquisition_status_label' in globals():
-        root.after(0, lambda: acquisition_status_label.config(text=message))
+    """Queue a status message; drain_status_queue applies it on the Tk thread"""
+    status_queue.put(message)
+
+
+def drain_status_queue():
+    """Apply queued status messages to the acquisition label
+
+    Runs on the Tk thread every 50 ms so worker threads never touch
+    widgets directly; only the latest queued message is shown."""
+    message = None
+    while True:
+        try:
+            message = status_queue.get_nowait()
+        except queue.Empty:
+            break
+    if message is not None and 'acquisition_status_label' in globals():
+        acquisition_status_label.config(text=message)
+    root.after(50, drain_status_queue)
+
+
+def ask_yes_no_on_main_thread(title, message):
+    """Show a yes/no messagebox on the Tk main thread and wait for the answer
+
+    Safe to call from acquisition worker threads: Tk dialogs must run on the
+    main thread, so the prompt is posted via root.after and the result is
+    handed back through a queue."""
+    result_queue = queue.Queue()
+    root.after(0, lambda: result_queue.put(messagebox.askyesno(title, message)))
+    return result_queue.get()
 
 
 def load_acquisition_from_csv():
@@ -175,6 +448,7 @@ def load_acquisition_from_csv():
         # Clear existing rows in the tree
         for item in tree.get_children():
             tree.delete(item)
+        acquisition_plan.clear()
 
         # Read CSV and group by wavelength
         wavelength_dict = {}
@@ -183,7 +457,8 @@ def load_acquisition_from_csv():
             reader = csv.DictReader(csvfile)
             for row in reader:
                 # Only load acquisitions that are not completed (pending, timeout, or cancelled)
-                if row['Status'] in ['pending', 'timeout', 'cancelled']:
+                # Status fields are padded to a fixed width in the log
+                if row['Status'].strip() in ['pending', 'timeout', 'cancelled']:
                     wavelength = row['Wavelength']
                     if wavelength not in wavelength_dict:
                         wavelength_dict[wavelength] = 0
@@ -192,7 +467,8 @@ def load_acquisition_from_csv():
         # Populate the tree with grouped data
         if wavelength_dict:
             for wavelength, count in wavelength_dict.items():
-                tree.insert("", "end", values=(wavelength, count))
+                iid = tree.insert("", "end", values=(wavelength, count))
+                acquisition_plan[iid] = (wavelength, count)
 
             messagebox.showinfo("Success",
                                 f"Loaded {sum(wavelength_dict.values())} incomplete acquisitions from {len(wavelength_dict)} wavelengths")
@@ -218,6 +494,7 @@ def select_raw_data_folder():
         raw_data_folder = folder
         raw_folder_label.config(text=f"Raw folder: {folder}")
         logging.info(f"Raw data folder selected: {folder}")
+        start_raw_folder_watcher()
         check_device_status()
     else:
         messagebox.showwarning("Warning", "Raw data folder must be selected before starting acquisition")
@@ -230,15 +507,159 @@ def load_folder():
         process_folder(folder_path)
 
 
+# ENVI "data type" codes -> NumPy dtypes
+ENVI_DTYPES = {
+    '1': np.uint8, '2': np.int16, '3': np.int32, '4': np.float32,
+    '5': np.float64, '6': np.complex64, '9': np.complex128,
+    '12': np.uint16, '13': np.uint32, '14': np.int64, '15': np.uint64,
+}
+
+_header_template_lock = threading.Lock()
+
+
+class LazyEnviCube:
+    """Placeholder for an ENVI cube that has not been opened yet
+
+    Cubes whose header matches the cached template skip envi.open entirely
+    at browse time; the real image is opened on first use (i.e. only if the
+    cube is actually selected for summing or averaging)."""
+
+    def __init__(self, hdr_path, bin_path):
+        self.hdr_path = hdr_path
+        self.bin_path = bin_path
+        self._image = None
+
+    def _open(self):
+        if self._image is None:
+            self._image = envi.open(self.hdr_path, self.bin_path)
+        return self._image
+
+    def open_memmap(self, **kwargs):
+        return self._open().open_memmap(**kwargs)
+
+    def load(self):
+        return self._open().load()
+
+
+def _make_header_template(hdr_path, metadata):
+    """Capture the cube layout parsed from the first header of a project
+
+    All cubes in a project share samples/lines/bands/dtype/interleave, so
+    subsequent cubes can be mapped directly without re-parsing their
+    headers."""
+    lines = int(metadata['lines'])
+    bands = int(metadata['bands'])
+    samples = int(metadata['samples'])
+    interleave = str(metadata.get('interleave', 'bil')).lower()
+    dtype = np.dtype(ENVI_DTYPES[str(metadata['data type'])])
+    if str(metadata.get('byte order', '0')) == '1':
+        dtype = dtype.newbyteorder('>')
+
+    if interleave == 'bil':
+        shape = (lines, bands, samples)
+    elif interleave == 'bip':
+        shape = (lines, samples, bands)
+    else:  # bsq
+        shape = (bands, lines, samples)
+
+    with open(hdr_path, 'rb') as f:
+        header_bytes = f.read()
+
+    return {'shape': shape, 'dtype': dtype, 'interleave': interleave,
+            'offset': int(metadata.get('header offset', 0)),
+            'metadata': metadata, 'header_bytes': header_bytes}
+
+
+def _header_matches(hdr_path, template):
+    try:
+        with open(hdr_path, 'rb') as f:
+            return f.read() == template['header_bytes']
+    except OSError:
+        return False
+
+
+def _read_rgb_bands_direct(bin_path, template, bands):
+    """Read a band subset straight off the raw .bin via the cached layout"""
+    arr = np.memmap(bin_path, dtype=template['dtype'], mode='r',
+                    offset=template['offset'], shape=template['shape'])
+    if template['interleave'] == 'bil':
+        return np.ascontiguousarray(arr[:, list(bands), :].transpose(0, 2, 1))
+    if template['interleave'] == 'bip':
+        return np.ascontiguousarray(arr[:, :, list(bands)])
+    # bsq
+    return np.ascontiguousarray(arr[list(bands)].transpose(1, 2, 0))
+
+
+def _save_rgb_fast(path, cube_hw3, size=None):
+    """Save an (H, W, 3) band slice as an 8-bit PNG
+
+    Does the 2-98 percentile stretch per channel and the uint8 conversion in
+    vectorized NumPy, then encodes with a low PNG compression level — much
+    cheaper than the generic spy.save_rgb pathway. If size is given the
+    image is downsampled before encoding."""
+    arr = np.asarray(cube_hw3, dtype=np.float32)
+    lo, hi = np.percentile(arr, [2, 98], axis=(0, 1))
+    scale = np.where(hi > lo, 255.0 / np.maximum(hi - lo, 1e-12), 1.0).astype(np.float32)
+    rgb8 = np.clip((arr - lo.astype(np.float32)) * scale, 0, 255).astype(np.uint8)
+
+    img = Image.fromarray(rgb8)
+    if size is not None:
+        img = img.resize(size, Image.Resampling.BILINEAR)
+    img.save(path, optimize=False, compress_level=1)
+
+
+def _load_one(subfolder, wavelength, i, header_cache):
+    """Open one hyperspectral cube and render its RGB image (worker thread)
+
+    Returns (cube, metadata, wavelength, i, rgb_path). Only the three RGB
+    bands are read here — the full cube stays on disk until the user
+    actually selects it for summing or averaging. The first cube of a load
+    parses its header through envi.open and caches the layout; cubes with
+    an identical header are then mapped directly without any parsing."""
+    hdr_path = os.path.join(subfolder, 'spectral_image_processed_image.hdr')
+    bin_path = os.path.join(subfolder, 'spectral_image_processed_image.bin')
+
+    logging.info(f"Loading hyperspectral cube from: {hdr_path} and {bin_path}")
+
+    # Define the RGB bands
+    rgb_bands = (29, 19, 9)  # Adjust these bands as needed
+
+    template = header_cache.get('template')
+    if template is not None and _header_matches(hdr_path, template):
+        # Fast path: same layout as the first cube, read the bands straight
+        # off the raw file and defer envi.open until the cube is used
+        rgb_cube = _read_rgb_bands_direct(bin_path, template, rgb_bands)
+        cube = LazyEnviCube(hdr_path, bin_path)
+        metadata = template['metadata']
+    else:
+        meta_cube = envi.open(hdr_path, bin_path)
+        rgb_cube = meta_cube.read_bands(rgb_bands)
+        cube = meta_cube
+        metadata = meta_cube.metadata
+        with _header_template_lock:
+            header_cache.setdefault('template', _make_header_template(hdr_path, metadata))
+
+    # Save the RGB image, already downsampled to the grid thumbnail size
+    output_rgb_image = os.path.join(subfolder, 'rgb_image.png')
+    _save_rgb_fast(output_rgb_image, rgb_cube, size=(200, 150))
+    logging.info(f"RGB image saved at: {output_rgb_image}")
+
+    return cube, metadata, wavelength, i, output_rgb_image
+
+
 def process_folder(folder_path):
     # Clear previous images
-    for widget in image_panel_frame.winfo_children():
-        widget.destroy()
+    _clear_virtual_grid()
 
     # Clear previous cubes, selections, and wavelengths
     loaded_cubes.clear()
     selected_images.clear()
     loaded_images.clear()
+    wavelength_index.clear()
+    # Drop thumbnails from the previous folder; _pil_thumb_cache has no LRU
+    # bound, so this is what keeps it from growing across folder loads
+    _thumb_cache.clear()
+    _pil_thumb_cache.clear()
     sum_cubes_button.config(state="disabled")
     average_cubes_button.config(state="disabled")
     view_selected_button.config(state="disabled")
@@ -256,16 +677,8 @@ def process_folder(folder_path):
 
     loaded_folders = 0  # Track the number of folders processed
 
-    # Create a frame that will contain the grid of images
-    image_grid_frame = tk.Frame(image_panel_frame)
-    image_grid_frame.pack(fill=tk.BOTH, expand=True)
-
-    # Number of columns in the grid
-    num_columns = 4  # Adjust this based on your preferred layout
-    current_row = 0
-    current_column = 0
-
-    # Loop through each subfolder and process the hyperspectral images
+    # Collect the subfolders that actually contain hyperspectral data
+    tasks = []
     for subfolder in subfolders:
         folder_name = os.path.basename(subfolder)
         parts = folder_name.split('_')
@@ -278,66 +691,48 @@ def process_folder(folder_path):
             bin_path = os.path.join(subfolder, 'spectral_image_processed_image.bin')
 
             if os.path.exists(hdr_path) and os.path.exists(bin_path):
-                logging.info(f"Loading hyperspectral cube from: {hdr_path} and {bin_path}")
-                try:
-                    # Load the cube using spectral.io.envi
-                    meta_cube = envi.open(hdr_path, bin_path)
-                    cube = meta_cube.load()
-
-                    # Define the RGB bands
-                    rgb_bands = (29, 19, 9)  # Adjust these bands as needed
-
-                    # Save the RGB image
-                    output_rgb_image = os.path.join(subfolder, 'rgb_image.png')
-                    spy.save_rgb(output_rgb_image, cube, rgb_bands)
-                    logging.info(f"RGB image saved at: {output_rgb_image}")
-
-                    # Store the cube data and metadata, along with the path to the RGB image
-                    loaded_cubes.append((cube, meta_cube.metadata, wavelength, i, output_rgb_image))
-                    available_wavelengths.add(wavelength)  # Track unique wavelengths
-
-                    # Display the image
-                    img = Image.open(output_rgb_image)
-                    img = img.resize((200, 150), Image.Resampling.LANCZOS)  # Slightly smaller for grid layout
-                    img_tk = ImageTk.PhotoImage(img)
-
-                    # Store the image to prevent garbage collection
-                    loaded_images.append(img_tk)
-
-                    # Create a frame for each image, its label, and checkbox
-                    image_frame = tk.Frame(image_grid_frame)
-                    image_frame.grid(row=current_row, column=current_column, padx=5, pady=5, sticky='nsew')
-
-                    # Display the image in the frame
-                    img_label = tk.Label(image_frame, image=img_tk)
-                    img_label.pack()
-
-                    # Create a variable to track the checkbox state
-                    checkbox_var = tk.BooleanVar()
-
-                    # Create a checkbox next to the image name and make it selectable
-                    checkbox = tk.Checkbutton(image_frame, text=f'{wavelength}_{i}', variable=checkbox_var,
-                                              onvalue=True, offvalue=False,
-                                              command=lambda idx=len(loaded_cubes) - 1,
-                                                             var=checkbox_var: toggle_image_selection(idx, var))
-                    checkbox.pack(pady=5)
-
-                    # Update grid position for next image
-                    current_column += 1
-                    if current_column >= num_columns:
-                        current_column = 0
-                        current_row += 1
-
-                    # Update the progress after each subfolder is processed
-                    loaded_folders += 1
-                    progress_label.config(text=f"Loaded {loaded_folders} of {total_subfolders} subfolders")
-                    root.update_idletasks()
-
-                except Exception as e:
-                    logging.error(f"Error loading or processing cube: {e}")
+                tasks.append((subfolder, wavelength, i))
             else:
                 logging.warning(f"Hyperspectral files not found in {subfolder}")
 
+    # Throttle progress redraws — update_idletasks forces a full Tk redraw,
+    # so doing it per subfolder dominates large loads
+    last_progress_update = 0.0
+
+    # Load the cubes and render their RGB images in parallel; the Tk widget
+    # work stays on the main thread as results complete
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        header_cache = {}  # Layout of the first parsed header, shared by all workers
+        futures = [executor.submit(_load_one, subfolder, wavelength, i, header_cache)
+                   for subfolder, wavelength, i in tasks]
+
+        # Consume in submission (scandir) order so loaded_cubes, and with it
+        # the grid layout and cube numbering, is stable run-to-run
+        for future in futures:
+            try:
+                cube, metadata, wavelength, i, output_rgb_image = future.result()
+            except Exception as e:
+                logging.error(f"Error loading or processing cube: {e}")
+                continue
+
+            # Store the (still unloaded) cube and metadata, along with the path to the RGB image
+            loaded_cubes.append((cube, metadata, wavelength, i, output_rgb_image))
+            available_wavelengths.add(wavelength)  # Track unique wavelengths
+            wavelength_index.setdefault(wavelength, []).append(len(loaded_cubes) - 1)
+
+            # Update the progress at most every 100 ms
+            loaded_folders += 1
+            if time.monotonic() - last_progress_update > 0.1:
+                progress_label.config(text=f"Loaded {loaded_folders} of {total_subfolders} subfolders")
+                root.update_idletasks()
+                last_progress_update = time.monotonic()
+
+    # Warm the thumbnail cache in the background so scrolling stays smooth
+    preload_thumbs([entry[4] for entry in loaded_cubes])
+
+    # Show the loaded cubes; only the visible tiles get widgets
+    render_image_grid(range(len(loaded_cubes)))
+
     # Final update to the progress label in case all subfolders were processed
     progress_label.config(text=f"Loaded {loaded_folders} of {total_subfolders} subfolders")
 
@@ -348,22 +743,101 @@ def process_folder(folder_path):
 # ------------------------------
 # 4. DEVICE COMMUNICATION FUNCTIONS
 # ------------------------------
+# USB vendor IDs for Arduino boards and the serial bridges they ship with
+ARDUINO_USB_VIDS = {0x2341, 0x2A03, 0x10C4, 0x1A86}
+
+
+def _device_cache_path(filename):
+    """Path of a cached device-address file under the per-user app folder"""
+    base = os.environ.get('APPDATA', os.path.expanduser('~'))
+    cache_dir = os.path.join(base, 'LaserSnapV2')
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, filename)
+
+
+def _read_cached_address(filename):
+    try:
+        with open(_device_cache_path(filename)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_address(filename, address):
+    try:
+        with open(_device_cache_path(filename), 'w') as f:
+            f.write(address)
+    except OSError as e:
+        logging.warning(f"Could not cache device address: {e}")
+
+
+def _get_resource_manager():
+    """Return the shared pyvisa ResourceManager, creating it on first use
+
+    VISA library initialization is paid once per process instead of on
+    every probe or acquisition start."""
+    global _visa_rm
+    if _visa_rm is None:
+        _visa_rm = pyvisa.ResourceManager()
+    return _visa_rm
+
+
+def open_tls_connection():
+    """Open (or reuse) the persistent VISA session to the TLS
+
+    Session negotiation with the instrument is slow enough to notice at
+    acquisition start, so the handle is cached for the whole app run;
+    callers retune device.timeout instead of reopening."""
+    global _tls_device
+    if _tls_device is None:
+        _tls_device = _get_resource_manager().open_resource(tls_device_address)
+    return _tls_device
+
+
+def _close_tls_connection():
+    global _tls_device
+    if _tls_device is not None:
+        _tls_device.close()
+        _tls_device = None
+    if _visa_rm is not None:
+        _visa_rm.close()
+
+
+atexit.register(_close_tls_connection)
+
+
 def check_tls_device():
     try:
-        rm = pyvisa.ResourceManager()
+        rm = _get_resource_manager()
+
+        # Try the last-known good address first so repeated lookups don't
+        # re-probe every VISA resource
+        cached = _read_cached_address('tls_address.txt')
+        if cached:
+            try:
+                device = rm.open_resource(cached, open_timeout=500)
+                if "CS130B" in device.query('*IDN?'):
+                    logging.info(f"TLS device found at cached address {cached}")
+                    return True, cached
+            except pyvisa.VisaIOError:
+                logging.info(f"Cached TLS address {cached} did not respond; re-enumerating")
+
         resources = rm.list_resources()
         logging.info(f"VISA Resources found: {resources}")
         if not resources:
             logging.info("No VISA resources found.")
             return False, None
-        print('check')
+
         for resource in resources:
             try:
-                device = rm.open_resource(resource)
-                logging.info(f"Device Query: {device.query('*IDN?')}")
-                print(device.query('*IDN?'))
-                if "CS130B" in device.query('*IDN?'):
+                # Bounded open timeout so one unresponsive resource can't
+                # stall the whole probe
+                device = rm.open_resource(resource, open_timeout=500)
+                idn = device.query('*IDN?')
+                logging.info(f"Device Query: {idn}")
+                if "CS130B" in idn:
                     logging.info(f"TLS device found at {resource}")
+                    _write_cached_address('tls_address.txt', resource)
                     return True, resource
             except pyvisa.VisaIOError:
                 continue
@@ -384,10 +858,19 @@ def check_arduino_device():
             logging.info("No serial ports found.")
             return False, None
 
+        # Probe the last-known good port first
+        cached = _read_cached_address('arduino_port.txt')
+        if cached:
+            ports.sort(key=lambda p: p.device != cached)
+
         for port in ports:
             logging.info(f"Port Description: {port.description}")
-            if "Arduino" in port.description or "CP210" in port.description:
+            # Match on USB vendor ID where available; fall back to the
+            # description string for older drivers
+            if (port.vid in ARDUINO_USB_VIDS
+                    or "Arduino" in port.description or "CP210" in port.description):
                 logging.info(f"Arduino found at {port.device}")
+                _write_cached_address('arduino_port.txt', port.device)
                 return True, port.device
 
         logging.info("Arduino device not found.")
@@ -411,11 +894,35 @@ def find_tls():
         messagebox.showerror("Error", "TLS device not found")
 
 
+def open_arduino_connection():
+    """Open (or reopen) the persistent serial connection to the Arduino
+
+    Opening the port resets most Arduino boards via DTR, so the 2 s
+    post-open settle happens once here instead of once per trigger."""
+    global _arduino_ser
+
+    if _arduino_ser is not None and _arduino_ser.is_open:
+        _arduino_ser.close()
+
+    _arduino_ser = serial.Serial(arduino_port, 9600, timeout=1, dsrdtr=False)
+    time.sleep(2)
+    logging.info(f"Opened persistent Arduino connection on {arduino_port}")
+
+
+def _close_arduino_connection():
+    if _arduino_ser is not None and _arduino_ser.is_open:
+        _arduino_ser.close()
+
+
+atexit.register(_close_arduino_connection)
+
+
 def find_golden_eye():
     global golden_eye_found, arduino_port
     golden_eye_found, arduino_port = check_arduino_device()
 
     if golden_eye_found:
+        open_arduino_connection()
         golden_eye_status_label.config(bg='green')
         find_golden_eye_button.config(state='disabled')
         check_device_status()
@@ -430,12 +937,20 @@ def check_device_status():
         load_csv_button.config(state='normal')
 
 
+def tls_goto_wavelength(device, wavelength):
+    """Move the TLS to a wavelength and wait for operation-complete
+
+    The CS130B supports *OPC?, which blocks until the motion finishes —
+    typically well under the worst-case fixed settle time."""
+    device.write(f'gowave {wavelength}')
+    logging.info(f"TLS Command Sent: gowave {wavelength}")
+    device.query('*OPC?')
+
+
 def send_trigger():
-    baud_rate = 9600
-    with serial.Serial(arduino_port, baud_rate, timeout=1) as ser:
-        time.sleep(2)
-        ser.write(trigger_string.encode('utf-8'))
-        logging.info(f"Sent: {trigger_string.strip()}")
+    _arduino_ser.write(trigger_string.encode('utf-8'))
+    _arduino_ser.flush()
+    logging.info(f"Sent: {trigger_string.strip()}")
 
 
 # ------------------------------
@@ -446,28 +961,31 @@ def sum_selected_cubes():
         messagebox.showerror("Error", "No images selected for summing.")
         return
 
-    combined_cube = None
-    first_hdr_metadata = None
     rgb_bands = (29, 19, 9)  # Example of RGB bands
-
-    for idx in selected_images:
-        cube_data, cube_metadata, wavelength, i, _ = loaded_cubes[idx]
-
-        logging.info(f"Summing cube for {wavelength}_{i}")
-
-        # Sum the cubes
-        if combined_cube is None:
-            combined_cube = cube_data
-            first_hdr_metadata = cube_metadata
-        else:
-            # Ensure the cubes have the same dimensions
-            assert combined_cube.shape == cube_data.shape, "Cubes must have the same dimensions for summing."
-            combined_cube += cube_data
+    selection = sorted(selected_images)
+    first_hdr_metadata = loaded_cubes[selection[0]][1]
+
+    logging.info(f"Summing {len(selection)} selected cubes")
+
+    # Memory-map the selected cubes and reduce them tile-by-tile along the
+    # line axis, so only the float32 accumulator is ever resident in full
+    memmaps = [loaded_cubes[idx][0].open_memmap(writable=False) for idx in selection]
+    assert len({m.shape for m in memmaps}) == 1, "Cubes must have the same dimensions for summing."
+
+    combined_cube = np.zeros(memmaps[0].shape, dtype=np.float32)
+    lines = combined_cube.shape[0]
+    for start in range(0, lines, REDUCTION_TILE_LINES):
+        stop = min(start + REDUCTION_TILE_LINES, lines)
+        out_tile = combined_cube[start:stop]
+        for mm in memmaps:
+            # Fused cast-and-add into the float32 accumulator, so uint16 or
+            # float64 inputs never promote the arithmetic to float64
+            np.add(out_tile, mm[start:stop], out=out_tile, casting='unsafe')
 
     if combined_cube is not None:
         # Save the summed RGB image temporarily
         summed_rgb_image = os.path.join(SAVED_IMAGES_DIRECTORY, 'summed_rgb_image.png')
-        spy.save_rgb(summed_rgb_image, combined_cube, rgb_bands)
+        _save_rgb_fast(summed_rgb_image, combined_cube[:, :, list(rgb_bands)])
         logging.info(f"Summed RGB image saved at: {summed_rgb_image}")
 
         # Show the combined image in a popup window and provide Save options
@@ -481,34 +999,36 @@ def average_selected_cubes():
         messagebox.showerror("Error", "No images selected for averaging.")
         return
 
-    combined_cube = None
-    first_hdr_metadata = None
     rgb_bands = (29, 19, 9)  # Example of RGB bands
-    cube_count = 0
-
-    for idx in selected_images:
-        cube_data, cube_metadata, wavelength, i, _ = loaded_cubes[idx]
-
-        logging.info(f"Including cube for {wavelength}_{i} in average")
-
-        # Add the cubes
-        if combined_cube is None:
-            combined_cube = cube_data.copy()  # Use copy to avoid modifying original
-            first_hdr_metadata = cube_metadata
-        else:
-            # Ensure the cubes have the same dimensions
-            assert combined_cube.shape == cube_data.shape, "Cubes must have the same dimensions for averaging."
-            combined_cube += cube_data
-
-        cube_count += 1
+    selection = sorted(selected_images)
+    first_hdr_metadata = loaded_cubes[selection[0]][1]
+    cube_count = len(selection)
+
+    logging.info(f"Averaging {cube_count} selected cubes")
+
+    # Memory-map the selected cubes and reduce them tile-by-tile along the
+    # line axis, so only the float32 accumulator is ever resident in full
+    memmaps = [loaded_cubes[idx][0].open_memmap(writable=False) for idx in selection]
+    assert len({m.shape for m in memmaps}) == 1, "Cubes must have the same dimensions for averaging."
+
+    combined_cube = np.zeros(memmaps[0].shape, dtype=np.float32)
+    lines = combined_cube.shape[0]
+    for start in range(0, lines, REDUCTION_TILE_LINES):
+        stop = min(start + REDUCTION_TILE_LINES, lines)
+        out_tile = combined_cube[start:stop]
+        for mm in memmaps:
+            # Fused cast-and-add into the float32 accumulator, so uint16 or
+            # float64 inputs never promote the arithmetic to float64
+            np.add(out_tile, mm[start:stop], out=out_tile, casting='unsafe')
+
+    # Scale in place by the constant reciprocal — no new cube-sized
+    # allocation and multiply is cheaper than divide
+    np.multiply(combined_cube, np.float32(1.0 / cube_count), out=combined_cube)
 
     if combined_cube is not None and cube_count > 0:
-        # Divide by the number of cubes to get the average
-        combined_cube = combined_cube / cube_count
-
         # Save the averaged RGB image temporarily
         averaged_rgb_image = os.path.join(SAVED_IMAGES_DIRECTORY, 'averaged_rgb_image.png')
-        spy.save_rgb(averaged_rgb_image, combined_cube, rgb_bands)
+        _save_rgb_fast(averaged_rgb_image, combined_cube[:, :, list(rgb_bands)])
         logging.info(f"Averaged RGB image saved at: {averaged_rgb_image}")
 
         # Show the combined image in a popup window and provide Save options
@@ -551,7 +1071,7 @@ def add_cubes_for_same_wavelength(folders):
 
         rgb_bands = (29, 19, 9)
         output_rgb_file = os.path.join(output_path, f'{project_name}_{date_str}_{wavelength}_combined.png')
-        spy.save_rgb(output_rgb_file, combined_cube, rgb_bands)
+        _save_rgb_fast(output_rgb_file, np.asarray(combined_cube)[:, :, list(rgb_bands)])
         logging.info(f"Saved combined RGB image for wavelength {wavelength} at {output_rgb_file}")
 
         output_hdr_file = os.path.join(output_path, f'{project_name}_{date_str}_{wavelength}_union.hdr')
@@ -693,10 +1213,7 @@ def execute_commands():
 
     # Build acquisition plan and pre-populate log
     acquisition_index = 0
-    for child in tree.get_children():
-        wavelength = tree.item(child)["values"][0]
-        num_pictures = int(tree.item(child)["values"][1])
-
+    for wavelength, num_pictures in acquisition_plan.values():
         for i in range(1, num_pictures + 1):
             expected_name = f"{project_name}_{wavelength}_{i}"
             acquisition_log.append({
@@ -705,96 +1222,176 @@ def execute_commands():
                 'pic_num': i,
                 'expected_name': expected_name
             })
-
-            # Pre-populate log file
-            update_acquisition_log(acquisition_log_path, acquisition_index, wavelength, i,
-                                   expected_name, '', 'pending', 0)
             acquisition_index += 1
 
-    # Start acquisition
-    rm = pyvisa.ResourceManager()
-    device = rm.open_resource(tls_device_address)
-    device.timeout = 6000
-    take_snapshot()
-
-    # Execute acquisition commands sequentially
-    for entry in acquisition_log:
-        wavelength = entry['wavelength']
-        pic_num = entry['pic_num']
-        index = entry['index']
-
-        # Update status
-        update_status_label(f"Acquiring: {wavelength}nm #{pic_num} ({index + 1}/{len(acquisition_log)})")
-
-        # Send wavelength command
-        device.write(f'gowave {wavelength}')
-        logging.info(f"TLS Command Sent: gowave {wavelength}")
-        time.sleep(5)
+    # Pre-populate the log file with the whole plan in a single pass
+    bulk_write_acquisition_log(acquisition_log_path, acquisition_log)
 
-        # Send trigger
-        send_trigger()
-        logging.info(f"Arduino Triggered for {wavelength}nm picture {pic_num}")
+    def _acquisition_worker():
+        global experiment_finished
 
-        # Wait for the new file
-        new_file = wait_for_new_file(file_timeout)
+        try:
+            # Hoist loop invariants out of the per-shot path
+            raw_folder = Path(raw_data_folder)
+
+            # Start acquisition on the cached VISA session
+            device = open_tls_connection()
+            device.timeout = 10000  # Bounds the *OPC? wait for the slowest moves
+            take_snapshot()
+
+            # Move to the first wavelength before entering the loop; each following
+            # move is issued as soon as the previous file lands, so the monochromator
+            # slews while the log and UI work for that shot is still going on
+            if acquisition_log:
+                with device_lock:
+                    tls_goto_wavelength(device, acquisition_log[0]['wavelength'])
+
+            move_in_flight = False
+
+            # Execute acquisition commands sequentially
+            for entry in acquisition_log:
+                wavelength = entry['wavelength']
+                pic_num = entry['pic_num']
+                index = entry['index']
+
+                # Update status
+                update_status_label(f"Acquiring: {wavelength}nm #{pic_num} ({index + 1}/{len(acquisition_log)})")
+
+                with device_lock:
+                    # Make sure an overlapped move from the previous iteration is done
+                    if move_in_flight:
+                        device.query('*OPC?')
+                        move_in_flight = False
+
+                    # Send trigger
+                    send_trigger()
+                logging.info(f"Arduino Triggered for {wavelength}nm picture {pic_num}")
+
+                # Wait for the new file
+                new_file = wait_for_new_file(file_timeout)
+
+                # Start the next TLS move now that the capture is finished; it
+                # overlaps with the log update below and the next status update
+                if index + 1 < len(acquisition_log):
+                    next_wavelength = acquisition_log[index + 1]['wavelength']
+                    with device_lock:
+                        device.write(f'gowave {next_wavelength}')
+                    logging.info(f"TLS Command Sent: gowave {next_wavelength}")
+                    move_in_flight = True
+
+                if new_file:
+                    # Update log with successful acquisition
+                    file_size = (raw_folder / new_file).stat().st_size
 
-        if new_file:
-            # Update log with successful acquisition
-            file_path = os.path.join(raw_data_folder, new_file)
-            file_size = os.path.getsize(file_path)
+                    update_acquisition_log(
+                        acquisition_log_path,
+                        index,
+                        wavelength,
+                        pic_num,
+                        entry['expected_name'],
+                        new_file,
+                        'completed',
+                        file_size
+                    )
 
-            update_acquisition_log(
-                acquisition_log_path,
-                index,
-                wavelength,
-                pic_num,
-                entry['expected_name'],
-                new_file,
-                'completed',
-                file_size
-            )
-
-            update_status_label(f"Completed: {wavelength}nm #{pic_num} -> {new_file}")
-        else:
-            # Timeout occurred
-            update_acquisition_log(
-                acquisition_log_path,
-                index,
-                wavelength,
-                pic_num,
-                entry['expected_name'],
-                '',
-                'timeout',
-                0
-            )
-
-            # Ask user if they want to continue
-            result = messagebox.askyesno(
-                "Acquisition Timeout",
-                f"No file detected for {wavelength}nm #{pic_num}.\n"
-                f"Do you want to continue with the next acquisition?"
-            )
-
-            if not result:
-                # Mark remaining as cancelled
-                for remaining_entry in acquisition_log[index + 1:]:
+                    update_status_label(f"Completed: {wavelength}nm #{pic_num} -> {new_file}")
+                else:
+                    # Timeout occurred
                     update_acquisition_log(
                         acquisition_log_path,
-                        remaining_entry['index'],
-                        remaining_entry['wavelength'],
-                        remaining_entry['pic_num'],
-                        remaining_entry['expected_name'],
+                        index,
+                        wavelength,
+                        pic_num,
+                        entry['expected_name'],
                         '',
-                        'cancelled',
+                        'timeout',
                         0
                     )
-                break
 
-    experiment_finished = True
-    process_button.config(state='normal')
+                    # Ask user if they want to continue (dialog runs on the main thread)
+                    result = ask_yes_no_on_main_thread(
+                        "Acquisition Timeout",
+                        f"No file detected for {wavelength}nm #{pic_num}.\n"
+                        f"Do you want to continue with the next acquisition?"
+                    )
+
+                    if not result:
+                        # Mark remaining as cancelled in a single bulk write
+                        cancel_remaining_acquisitions(index + 1)
+                        break
+
+            # Final status update
+            update_status_label("Acquisition complete!")
+        except Exception as e:
+            # A dead worker must never leave the UI stuck on "Acquiring..."
+            logging.error(f"Acquisition failed: {e}")
+            update_status_label(f"Acquisition failed: {e}")
+            root.after(0, lambda e=e: messagebox.showerror(
+                "Acquisition Error", f"Acquisition stopped unexpectedly:\n{e}"))
+        finally:
+            experiment_finished = True
+            root.after(0, lambda: process_button.config(state='normal'))
+
+    # Run the acquisition loop off the Tk main thread so the UI stays
+    # responsive; all widget access above goes through root.after
+    threading.Thread(target=_acquisition_worker, daemon=True).start()
+
+
+def check_previous_acquisition():
+    """Find the most recent acquisition log in the selected project folder
+
+    Each candidate log is streamed once, counting rows instead of
+    materializing them. Returns the totals for the newest log, or None if
+    there is no log or nothing is left to do."""
+    with os.scandir(output_path) as it:
+        logs = [(entry.name, entry.stat().st_mtime) for entry in it
+                if entry.is_file()
+                and entry.name.startswith('acquisition_log_')
+                and entry.name.endswith('.csv')]
+    if not logs:
+        return None
+
+    logs.sort(key=itemgetter(1))
+    log_path = os.path.join(output_path, logs[-1][0])
 
-    # Final status update
-    update_status_label("Acquisition complete!")
+    total = completed = 0
+    try:
+        with open(log_path, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                total += 1
+                # Status fields are padded to a fixed width in the log
+                if row['Status'].strip() == 'completed':
+                    completed += 1
+    except (OSError, KeyError) as e:
+        logging.error(f"Error reading acquisition log {log_path}: {e}")
+        return None
+
+    if total == 0 or completed == total:
+        return None
+
+    return {'log_path': log_path, 'total': total,
+            'completed': completed, 'incomplete': total - completed}
+
+
+def resume_from_log(log_path):
+    """Load the incomplete entries from a previous acquisition log
+
+    One streaming pass over the CSV — rows are filtered as they are read,
+    so the log is never held in memory or rewritten."""
+    global acquisition_log
+
+    acquisition_log = []
+    with open(log_path, 'r', newline='') as f:
+        for row in csv.DictReader(f):
+            if row['Status'].strip() in ('pending', 'timeout', 'cancelled'):
+                acquisition_log.append({
+                    'index': int(row['Index']),
+                    'wavelength': row['Wavelength'],
+                    'pic_num': int(row['Picture_Number']),
+                    'expected_name': row['Expected_Name'],
+                })
+
+    logging.info(f"Resuming {len(acquisition_log)} acquisitions from {log_path}")
 
 
 def resume_acquisition():
@@ -835,49 +1432,65 @@ def resume_acquisition():
 
 
 def execute_resumed_commands():
-    """Execute commands for resumed acquisition"""
-    global experiment_finished, monitoring_thread, stop_monitoring
-    global current_acquisition_index, last_file_time
+    """Execute commands for resumed acquisition
 
+    New capture folders are reported by the saved-images watcher started at
+    app init, which sets file_arrived as folders appear."""
     # Check if raw data folder is selected
     if not raw_data_folder:
         messagebox.showerror("Error", "Please select the Golden Eye raw data folder first!")
         return
 
-    stop_monitoring = False
+    def _resume_worker():
+        global experiment_finished, current_acquisition_index
 
-    # Start file monitoring thread
-    monitoring_thread = threading.Thread(target=monitor_raw_files, daemon=True)
-    monitoring_thread.start()
+        try:
+            # Start acquisition
+            device = open_tls_connection()
+            device.timeout = 10000  # Bounds the *OPC? wait for the slowest moves
+
+            # Execute remaining acquisition commands
+            for i, entry in enumerate(acquisition_log):
+                wavelength = entry['wavelength']
+                pic_num = entry['pic_num']
 
-    # Start acquisition
-    rm = pyvisa.ResourceManager()
-    device = rm.open_resource(tls_device_address)
-    device.timeout = 6000
+                update_status_label(f"Acquiring: {wavelength}nm #{pic_num} ({i + 1}/{len(acquisition_log)})")
 
-    # Execute remaining acquisition commands
-    for i, entry in enumerate(acquisition_log):
-        wavelength = entry['wavelength']
-        pic_num = entry['pic_num']
+                # Block only until the monochromator reports the move complete
+                # instead of a fixed worst-case sleep
+                with device_lock:
+                    tls_goto_wavelength(device, wavelength)
 
-        update_status_label(f"Acquiring: {wavelength}nm #{pic_num} ({i + 1}/{len(acquisition_log)})")
+                # Clear before triggering so a folder that appears immediately
+                # after the trigger isn't missed
+                file_arrived.clear()
 
-        device.write(f'gowave {wavelength}')
-        logging.info(f"TLS Command Sent: gowave {wavelength}")
-        time.sleep(5)
+                with device_lock:
+                    send_trigger()
+                logging.info(f"Arduino Triggered for {wavelength}nm picture {pic_num}")
 
-        send_trigger()
-        logging.info(f"Arduino Triggered for {wavelength}nm picture {pic_num}")
+                current_acquisition_index = i
 
-        current_acquisition_index = i
-        time.sleep(20)  # Wait for acquisition
+                # Continue as soon as the monitor signals the new capture folder,
+                # with the old fixed wait as the safety timeout
+                if not file_arrived.wait(timeout=25):
+                    logging.warning(f"No new capture detected for {wavelength}nm picture {pic_num}")
 
-    experiment_finished = True
-    stop_monitoring = True
-    process_button.config(state='normal')
+            # Final status update
+            update_status_label("Resumed acquisition complete!")
+        except Exception as e:
+            # A dead worker must never leave the UI stuck on "Acquiring..."
+            logging.error(f"Resumed acquisition failed: {e}")
+            update_status_label(f"Resumed acquisition failed: {e}")
+            root.after(0, lambda e=e: messagebox.showerror(
+                "Acquisition Error", f"Resumed acquisition stopped unexpectedly:\n{e}"))
+        finally:
+            experiment_finished = True
+            root.after(0, lambda: process_button.config(state='normal'))
 
-    # Final status update
-    update_status_label("Resumed acquisition complete!")
+    # Sequence the VISA commands off the Tk main thread; widget updates go
+    # through the status queue and root.after
+    threading.Thread(target=_resume_worker, daemon=True).start()
 
 
 def process_results():
@@ -885,14 +1498,33 @@ def process_results():
         messagebox.showerror("Error", "Experiment is not finished yet!")
         return
 
-    after_snapshot = os.listdir(SAVED_IMAGES_DIRECTORY)
-    logging.info(f"New snapshot taken: {after_snapshot}")
-
-    new_folders = list(set(after_snapshot) - set(before_snapshot))
-    new_folders_sorted = sort_folders_by_modification(new_folders)
-    logging.info(f"Sorted new folders: {new_folders_sorted}")
-
-    total_pictures = sum(int(tree.item(child)["values"][1]) for child in tree.get_children())
+    if _saved_images_observer is not None and _saved_images_observer.is_alive():
+        # Drain the folder notifications accumulated since take_snapshot —
+        # no directory re-enumeration needed
+        new_folders = set()
+        while True:
+            try:
+                new_folders.add(_new_folder_queue.get_nowait())
+            except queue.Empty:
+                break
+        new_folders = list(new_folders)
+        new_folders_sorted = sort_folders_by_modification(new_folders)
+    else:
+        # Watcher unavailable: one scandir pass both diffs against the
+        # before_snapshot set and picks up the mtimes for sorting
+        with os.scandir(SAVED_IMAGES_DIRECTORY) as it:
+            new_entries = [(entry.name, entry.stat(follow_symlinks=False).st_mtime)
+                           for entry in it
+                           if entry.is_dir() and entry.name not in before_snapshot]
+        new_entries.sort(key=itemgetter(1))
+        new_folders_sorted = [name for name, _ in new_entries]
+
+    # Formatting the full folder listing is only worth it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sorted new folders: %s", new_folders_sorted)
+
+    # The mirrored plan avoids a Tcl round-trip per treeview row
+    total_pictures = sum(num_pictures for _, num_pictures in acquisition_plan.values())
     logging.info(f"Total pictures expected: {total_pictures}")
 
     if len(new_folders_sorted) == total_pictures:
@@ -912,8 +1544,9 @@ def add_row():
         messagebox.showerror("Error", "Both wavelength and number of pictures are required.")
         return
 
-    # Add the row to the treeview
-    tree.insert("", "end", values=(wavelength, num_pictures))
+    # Add the row to the treeview and the mirrored plan
+    iid = tree.insert("", "end", values=(wavelength, num_pictures))
+    acquisition_plan[iid] = (wavelength, int(num_pictures))
 
     # Clear entry fields after adding
     wavelength_entry.delete(0, tk.END)
@@ -960,8 +1593,9 @@ def edit_selected_row():
                 messagebox.showerror("Error", "Both fields are required.")
                 return
 
-            # Update the row
+            # Update the row and the mirrored plan
             tree.item(item_id, values=(wavelength, num_pictures))
+            acquisition_plan[item_id] = (wavelength, int(num_pictures))
             edit_dialog.destroy()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save changes: {e}")
@@ -982,17 +1616,18 @@ def delete_selected_row():
     if confirm:
         for item_id in selected_items:
             tree.delete(item_id)
+            acquisition_plan.pop(item_id, None)
 
 
 def toggle_image_selection(index, var):
     if var.get():  # If the checkbox is checked
-        if index not in selected_images:
-            selected_images.append(index)
+        selected_images.add(index)
     else:  # If the checkbox is unchecked
-        if index in selected_images:
-            selected_images.remove(index)
+        selected_images.discard(index)
 
-    logging.info(f"Selected Images: {selected_images}")
+    # Guarded so a click never pays for formatting the whole selection list
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Selected %d images: %s", len(selected_images), selected_images)
 
     # Enable or disable buttons depending on selections
     if selected_images:
@@ -1005,92 +1640,206 @@ def toggle_image_selection(index, var):
         view_selected_button.config(state="disabled")
 
 
-def filter_images():
-    global selected_images
+def _make_thumb(path):
+    """Decode and resize a thumbnail image (safe to run off the Tk thread)"""
+    img = Image.open(path)
+    if img.size != (200, 150):
+        # For JPEG sources draft() lets libjpeg decode straight to a
+        # near-target size; it is a no-op for PNG. BILINEAR on the already
+        # small image is indistinguishable from LANCZOS at 200x150.
+        img.draft('RGB', (200, 150))
+        img = img.resize((200, 150), Image.Resampling.BILINEAR)
+    img.load()
+    return img
 
-    # Store currently selected wavelength indices before filtering
-    selected_wavelengths = set()
-    for idx in selected_images:
-        if idx < len(loaded_cubes):
-            _, _, wavelength, _, _ = loaded_cubes[idx]
-            selected_wavelengths.add(wavelength)
 
-    # Clear current selections
-    selected_images = []
-    sum_cubes_button.config(state="disabled")
-    average_cubes_button.config(state="disabled")
-    view_selected_button.config(state="disabled")
+def _thumb_key(path):
+    """Cache key for a thumbnail: (path, mtime)
 
-    selected_wavelength = wavelength_filter.get()
+    _load_one rewrites rgb_image.png on every folder load, so keying on
+    mtime keeps a rewritten render from being served stale. Returns None
+    if the file is missing."""
+    try:
+        return path, os.stat(path).st_mtime
+    except OSError:
+        return None
 
-    # Clear the current image panel
-    for widget in image_panel_frame.winfo_children():
-        widget.destroy()
 
-    # Create a frame that will contain the grid of images
-    image_grid_frame = tk.Frame(image_panel_frame)
-    image_grid_frame.pack(fill=tk.BOTH, expand=True)
+def preload_thumbs(paths):
+    """Decode thumbnails on background threads ahead of display
 
-    # Number of columns in the grid
-    num_columns = 4  # Adjust this based on your preferred layout
-    current_row = 0
-    current_column = 0
+    PhotoImage objects must be created on the Tk thread, so the workers only
+    decode to PIL images; get_thumb picks those up and wraps them."""
+    def _worker(path, key):
+        try:
+            _pil_thumb_cache[key] = _make_thumb(path)
+        except Exception as e:
+            logging.error(f"Error preloading thumbnail {path}: {e}")
+
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    for path in paths:
+        # Skip anything already decoded or wrapped — reloading a folder
+        # should not redo cold-cache work
+        key = _thumb_key(path)
+        if key is not None and key not in _thumb_cache and key not in _pil_thumb_cache:
+            executor.submit(_worker, path, key)
+    executor.shutdown(wait=False)
+
+
+def get_thumb(path):
+    """Return the 200x150 PhotoImage for an RGB thumbnail (LRU cached)"""
+    key = _thumb_key(path)
+    if key is None:
+        return None
 
-    # Filter and display images according to selection
-    filtered_cubes = []
+    try:
+        img_tk = _thumb_cache.pop(key)
+    except KeyError:
+        img = _pil_thumb_cache.pop(key, None)
+        if img is None:
+            img = _make_thumb(path)
+        img_tk = ImageTk.PhotoImage(img)
+
+    _thumb_cache[key] = img_tk
+    while len(_thumb_cache) > THUMB_CACHE_SIZE:
+        _thumb_cache.popitem(last=False)
+    return img_tk
+
+
+def _make_grid_tile():
+    """Instantiate the widgets for one (initially blank) grid tile"""
+    tile = tk.Frame(image_panel_frame)
+    tile.idx = None
+    tile.img_label = tk.Label(tile)
+    tile.img_label.pack()
+    tile.checkbox_var = tk.BooleanVar()
+    tile.checkbox = tk.Checkbutton(tile, variable=tile.checkbox_var,
+                                   onvalue=True, offvalue=False,
+                                   command=lambda tile=tile: toggle_image_selection(tile.idx, tile.checkbox_var))
+    tile.checkbox.pack(pady=5)
+    return tile
+
+
+def _configure_tile(tile, pos):
+    """Point an existing tile at the cube for the given grid position"""
+    idx = grid_indices[pos]
+    _, _, wavelength, i, output_rgb_image = loaded_cubes[idx]
+
+    img_tk = get_thumb(output_rgb_image)
+    tile.img_label.config(image=img_tk if img_tk is not None else '')
+    tile.img_label.image = img_tk  # Keep a reference while displayed
+
+    # The checkbox state always mirrors selected_images, so selection
+    # survives tiles being recycled while scrolling
+    tile.idx = idx
+    tile.checkbox_var.set(idx in selected_images)
+    tile.checkbox.config(text=f'{wavelength}_{i}')
+
+    tile.place(x=(pos % GRID_COLUMNS) * GRID_TILE_WIDTH + 5,
+               y=(pos // GRID_COLUMNS) * GRID_TILE_HEIGHT + 5)
+
+
+def _update_visible_tiles():
+    """Show tiles for the visible row range, recycling ones scrolled away"""
+    top = canvas.canvasy(0)
+    bottom = top + max(canvas.winfo_height(), 1)
+
+    # One extra row of margin above and below the viewport
+    first_row = max(int(top // GRID_TILE_HEIGHT) - 1, 0)
+    last_row = int(bottom // GRID_TILE_HEIGHT) + 1
+    visible = set(range(first_row * GRID_COLUMNS,
+                        min((last_row + 1) * GRID_COLUMNS, len(grid_indices))))
+
+    for pos in [p for p in _grid_tiles if p not in visible]:
+        tile = _grid_tiles.pop(pos)
+        tile.place_forget()
+        _tile_pool.append(tile)
+
+    for pos in visible:
+        if pos not in _grid_tiles:
+            tile = _tile_pool.pop() if _tile_pool else _make_grid_tile()
+            _configure_tile(tile, pos)
+            _grid_tiles[pos] = tile
+
+
+def render_image_grid(indices):
+    """Show the given cubes in the image grid with virtual scrolling
+
+    Only O(visible) widgets exist at any time: the panel frame is sized for
+    the full grid, and tiles are instantiated/destroyed as the canvas
+    scrolls."""
+    global grid_indices
+    grid_indices = list(indices)
+
+    # Park every tile in the pool; _update_visible_tiles re-points the ones
+    # it needs instead of allocating fresh widgets
+    for pos in list(_grid_tiles):
+        tile = _grid_tiles.pop(pos)
+        tile.place_forget()
+        _tile_pool.append(tile)
+
+    num_rows = (len(grid_indices) + GRID_COLUMNS - 1) // GRID_COLUMNS
+    width = GRID_COLUMNS * GRID_TILE_WIDTH + 10
+    height = max(num_rows * GRID_TILE_HEIGHT + 10, 1)
+    image_panel_frame.config(width=width, height=height)
+    canvas.configure(scrollregion=(0, 0, width, height))
+    canvas.yview_moveto(0.0)
+
+    _update_visible_tiles()
+
+
+def _clear_virtual_grid():
+    """Destroy all displayed and pooled tiles (used when loading a new folder)"""
+    global grid_indices
+    grid_indices = []
+    for tile in _grid_tiles.values():
+        tile.destroy()
+    _grid_tiles.clear()
+    for tile in _tile_pool:
+        tile.destroy()
+    _tile_pool.clear()
+
+
+def _render_grid(filter_value, seed_selection_from_wavelengths=None):
+    """Render the image grid for one wavelength filter in a single pass
+
+    When seed_selection_from_wavelengths is given, the selection is reset
+    to the visible cubes whose wavelength is in that set before rendering;
+    otherwise the current selection is shown as-is."""
+    global selected_images
 
-    # Create filtered list based on selection
-    if selected_wavelength == 'No Filter':
-        filtered_cubes = list(enumerate(loaded_cubes))  # Include all cubes with their indices
+    # Look the filtered indices up instead of scanning every loaded cube
+    if filter_value == 'No Filter':
+        indices = list(range(len(loaded_cubes)))
     else:
-        # Only include cubes matching the selected wavelength
-        for idx, (cube, _, wavelength, i, _) in enumerate(loaded_cubes):
-            if wavelength == selected_wavelength:
-                filtered_cubes.append((idx, (cube, _, wavelength, i, _)))
-
-    # Display the filtered cubes in a grid
-    for idx, (cube, meta, wavelength, i, output_rgb_image) in filtered_cubes:
-        if os.path.exists(output_rgb_image):
-            img = Image.open(output_rgb_image)
-            img = img.resize((200, 150), Image.Resampling.LANCZOS)
-            img_tk = ImageTk.PhotoImage(img)
-
-            # Store the image to prevent garbage collection
-            loaded_images.append(img_tk)
-
-            # Create a frame for each image, its label, and checkbox
-            image_frame = tk.Frame(image_grid_frame)
-            image_frame.grid(row=current_row, column=current_column, padx=5, pady=5, sticky='nsew')
-
-            # Display the image in the frame
-            img_label = tk.Label(image_frame, image=img_tk)
-            img_label.pack()
-
-            # Create a variable to track the checkbox state
-            checkbox_var = tk.BooleanVar()
-
-            # Set initial state based on previous selection (if wavelength was selected)
-            if wavelength in selected_wavelengths:
-                checkbox_var.set(True)
-                selected_images.append(idx)
-
-            # Create a checkbox next to the image name and make it selectable
-            checkbox = tk.Checkbutton(image_frame, text=f'{wavelength}_{i}', variable=checkbox_var,
-                                      onvalue=True, offvalue=False,
-                                      command=lambda idx=idx, var=checkbox_var: toggle_image_selection(idx, var))
-            checkbox.pack(pady=5)
-
-            # Update grid position for next image
-            current_column += 1
-            if current_column >= num_columns:
-                current_column = 0
-                current_row += 1
-
-    # Enable buttons if there are selections after filtering
-    if selected_images:
-        sum_cubes_button.config(state="normal")
-        average_cubes_button.config(state="normal")
-        view_selected_button.config(state="normal")
+        indices = list(wavelength_index.get(filter_value, []))
+
+    if seed_selection_from_wavelengths is not None:
+        selected_images = {idx for idx in indices
+                           if loaded_cubes[idx][2] in seed_selection_from_wavelengths}
+
+    # Re-point the pooled tiles at the filtered set instead of rebuilding
+    # every frame/label/checkbox from scratch
+    render_image_grid(indices)
+
+
+def filter_images():
+    # Remember which wavelengths were selected so the selection can follow
+    # the filter change
+    selected_wavelengths = set()
+    for idx in selected_images:
+        if idx < len(loaded_cubes):
+            _, _, wavelength, _, _ = loaded_cubes[idx]
+            selected_wavelengths.add(wavelength)
+
+    _render_grid(wavelength_filter.get(),
+                 seed_selection_from_wavelengths=selected_wavelengths)
+
+    # Enable buttons only if there are selections after filtering
+    state = "normal" if selected_images else "disabled"
+    sum_cubes_button.config(state=state)
+    average_cubes_button.config(state=state)
+    view_selected_button.config(state=state)
 
 
 def view_selected_cubes():
@@ -1121,7 +1870,7 @@ def view_selected_cubes():
     text_area.config(yscrollcommand=scrollbar.set)
 
     # Populate the text area with selected cube information
-    for idx in selected_images:
+    for idx in sorted(selected_images):
         if idx < len(loaded_cubes):
             _, _, wavelength, i, _ = loaded_cubes[idx]
             text_area.insert(tk.END, f"• Cube {idx + 1}: Wavelength {wavelength}, Image {i}\n")
@@ -1147,14 +1896,9 @@ def select_by_wavelength():
         messagebox.showinfo("Selection", "Please select a wavelength first.")
         return
 
-    # Clear previous selections
+    # Select every cube with the chosen wavelength via the index
     global selected_images
-    selected_images = []
-
-    # Find all cubes with the selected wavelength
-    for idx, (_, _, cube_wavelength, _, _) in enumerate(loaded_cubes):
-        if cube_wavelength == wavelength:
-            selected_images.append(idx)
+    selected_images = set(wavelength_index.get(wavelength, ()))
 
     logging.info(f"Auto-selected {len(selected_images)} cubes with wavelength {wavelength}")
 
@@ -1175,71 +1919,11 @@ def select_by_wavelength():
 
 
 def update_selection_ui():
-    """Update checkbox states to reflect the current selections"""
-    # Just recreate the image display with the current selections
-    # Store currently selected wavelength indices
-    selected_wavelengths = set()
-    for idx in selected_images:
-        if idx < len(loaded_cubes):
-            _, _, wavelength, _, _ = loaded_cubes[idx]
-            selected_wavelengths.add(wavelength)
-
-    # Clear the current image panel
-    for widget in image_panel_frame.winfo_children():
-        widget.destroy()
-
-    # Create a frame that will contain the grid of images
-    image_grid_frame = tk.Frame(image_panel_frame)
-    image_grid_frame.pack(fill=tk.BOTH, expand=True)
-
-    # Number of columns in the grid
-    num_columns = 4  # Adjust this based on your preferred layout
-    current_row = 0
-    current_column = 0
-
-    # Get current filter state
-    current_filter = wavelength_filter.get()
-
-    # Display filtered images in a grid
-    for idx, (cube, _, wavelength, i, output_rgb_image) in enumerate(loaded_cubes):
-        # Skip images that don't match the filter (if a filter is applied)
-        if current_filter != 'No Filter' and wavelength != current_filter:
-            continue
-
-        if os.path.exists(output_rgb_image):
-            img = Image.open(output_rgb_image)
-            img = img.resize((200, 150), Image.Resampling.LANCZOS)
-            img_tk = ImageTk.PhotoImage(img)
-
-            # Store the image to prevent garbage collection
-            loaded_images.append(img_tk)
+    """Update checkbox states to reflect the current selections
 
-            # Create a frame for each image, its label, and checkbox
-            image_frame = tk.Frame(image_grid_frame)
-            image_frame.grid(row=current_row, column=current_column, padx=5, pady=5, sticky='nsew')
-
-            # Display the image in the frame
-            img_label = tk.Label(image_frame, image=img_tk)
-            img_label.pack()
-
-            # Create a variable to track the checkbox state
-            checkbox_var = tk.BooleanVar()
-
-            # Set initial state based on whether this index is selected
-            if idx in selected_images:
-                checkbox_var.set(True)
-
-            # Create a checkbox next to the image name and make it selectable
-            checkbox = tk.Checkbutton(image_frame, text=f'{wavelength}_{i}', variable=checkbox_var,
-                                      onvalue=True, offvalue=False,
-                                      command=lambda idx=idx, var=checkbox_var: toggle_image_selection(idx, var))
-            checkbox.pack(pady=5)
-
-            # Update grid position for next image
-            current_column += 1
-            if current_column >= num_columns:
-                current_column = 0
-                current_row += 1
+    The tile checkboxes mirror selected_images, so re-rendering the
+    current filter is enough to sync every visible checkbox."""
+    _render_grid(wavelength_filter.get())
 
 
 def update_wavelength_filters():
@@ -1311,8 +1995,20 @@ def show_averaged_image_popup(image_path, averaged_cube, metadata):
 
 def take_snapshot():
     global before_snapshot
-    before_snapshot = os.listdir(SAVED_IMAGES_DIRECTORY)
-    logging.info(f"Initial snapshot taken: {before_snapshot}")
+
+    # Drop folder notifications that predate this acquisition
+    while not _new_folder_queue.empty():
+        try:
+            _new_folder_queue.get_nowait()
+        except queue.Empty:
+            break
+
+    # A set makes the membership tests in process_results O(1)
+    with os.scandir(SAVED_IMAGES_DIRECTORY) as it:
+        before_snapshot = {entry.name for entry in it if entry.is_dir()}
+    logging.info(f"Initial snapshot taken: {len(before_snapshot)} folders")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Snapshot contents: %s", before_snapshot)
 
 
 def open_project_window(new_folders_sorted):
@@ -1360,19 +2056,25 @@ def rename_and_copy_folders(new_folders_sorted):
     date_str = datetime.now().strftime("%m-%d")
     current_index = 0
 
-    for child in tree.get_children():
-        wavelength = tree.item(child)["values"][0]
-        num_pictures = int(tree.item(child)["values"][1])
-
+    # Build the full transfer plan first, then copy in parallel — the
+    # link/clone syscalls release the GIL
+    transfers = []
+    for wavelength, num_pictures in acquisition_plan.values():
         for i in range(1, num_pictures + 1):
             new_name = f"{project_name}_{date_str}_{wavelength}_{i}"
             old_folder = os.path.join(SAVED_IMAGES_DIRECTORY, new_folders_sorted[current_index])
             new_folder = os.path.join(output_path, new_name)
+            transfers.append((old_folder, new_folder))
+            current_index += 1
 
-            shutil.copytree(old_folder, new_folder)
-            logging.info(f"Copied and renamed folder: {old_folder} -> {new_folder}")
+    def _copy_one(old_folder, new_folder):
+        shutil.copytree(old_folder, new_folder, copy_function=_clone_file)
+        logging.info(f"Copied and renamed folder: {old_folder} -> {new_folder}")
 
-            current_index += 1
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_copy_one, old, new) for old, new in transfers]
+        for future in futures:
+            future.result()
 
     messagebox.showinfo("Success", "Folders copied and renamed successfully!")
 
@@ -1554,9 +2256,15 @@ def setup_processing_tab(processing_frame):
     canvas = tk.Canvas(canvas_frame, xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
     canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    # Configure the scrollbars to work with the canvas
+    # Configure the scrollbars to work with the canvas; vertical scrolling
+    # re-renders the visible tile window of the virtual grid
+    def _scroll_y(*args):
+        canvas.yview(*args)
+        _update_visible_tiles()
+
     h_scrollbar.config(command=canvas.xview)
-    v_scrollbar.config(command=canvas.yview)
+    v_scrollbar.config(command=_scroll_y)
+    canvas.bind("<Configure>", lambda event: _update_visible_tiles())
 
     # Frame inside the canvas where images will be displayed in a grid
     image_panel_frame = tk.Frame(canvas)
@@ -1616,6 +2324,12 @@ def main():
     setup_acquisition_tab(acquisition_frame)
     setup_processing_tab(processing_frame)
 
+    # Watch for new capture folders from the Golden Eye
+    start_saved_images_watcher()
+
+    # Pump status messages from the acquisition workers into the UI
+    root.after(50, drain_status_queue)
+
     # Start main loop
     root.mainloop()
 